@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
-from .api import WeightWatchersApiClient
+from .api import DEFAULT_HOST_CONCURRENCY, WeightWatchersApiClient
 from .const import CONF_REGION, DOMAIN, PLATFORMS, REGION_TO_DOMAIN
 from .coordinator import WeightWatchersDataUpdateCoordinator
+from .store import WeightWatchersTokenStore
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+DATA_HOST_SEMAPHORES: HassKey[dict[str, asyncio.Semaphore]] = HassKey(
+    f"{DOMAIN}_host_semaphores"
+)
+
+
+@callback
+def async_get_host_semaphore(
+    hass: HomeAssistant, region_domain: str
+) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent requests to a WW region."""
+    semaphores = hass.data.setdefault(DATA_HOST_SEMAPHORES, {})
+    if region_domain not in semaphores:
+        semaphores[region_domain] = asyncio.Semaphore(DEFAULT_HOST_CONCURRENCY)
+    return semaphores[region_domain]
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the integration from YAML (not used)."""
@@ -36,13 +55,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     session = async_get_clientsession(hass)
-    region_domain = REGION_TO_DOMAIN[entry_data[CONF_REGION]]
+    region = entry_data[CONF_REGION]
 
     api = WeightWatchersApiClient(
         session=session,
-        region_domain=region_domain,
+        region=region,
         username=entry_data[CONF_USERNAME],
         password=entry_data[CONF_PASSWORD],
+        token_store=WeightWatchersTokenStore(hass, entry.entry_id),
+        host_semaphore=async_get_host_semaphore(hass, REGION_TO_DOMAIN[region]),
     )
     coordinator = WeightWatchersDataUpdateCoordinator(hass, api, entry)
 
@@ -61,3 +82,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await WeightWatchersTokenStore(hass, entry.entry_id).async_remove()
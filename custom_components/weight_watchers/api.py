@@ -2,18 +2,69 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
+import random
 import secrets
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date
-from typing import Any
-from urllib.parse import parse_qs, urlsplit
+from enum import StrEnum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
-
-from .const import CMX_SUMMARY_ENDPOINT, USER_AGENT, WW_PRIVACY_SETTINGS
+import orjson
+
+from .const import (
+    CMX_SUMMARY_ENDPOINT,
+    DEFAULT_SCAN_INTERVAL,
+    REGION_TO_DOMAIN,
+    REGION_URLS,
+    USER_AGENT,
+    WW_PRIVACY_SETTINGS,
+)
+
+if TYPE_CHECKING:
+    from .store import WeightWatchersTokenStore
+
+# Refresh tokens this many seconds before the JWT claims they expire.
+TOKEN_EXPIRY_MARGIN = 600
+
+# Concurrent requests allowed against one WW region at a time.
+DEFAULT_HOST_CONCURRENCY = 2
+
+# Transient statuses worth retrying; auth failures are never retried.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Per-attempt timeout; callers bound the whole update with their own deadline.
+_REQUEST_TIMEOUT = 10
+# Skip the CMX preflight if the host answered this recently; aiohttp keeps idle
+# connections alive for about this long.
+_CMX_WARM_WINDOW = 15
+# Upper bound for one request including all retries and backoff sleeps.
+_RETRY_DEADLINE = 20
+
+_LOGIN_HEADERS = MappingProxyType(
+    {
+        "User-Agent": USER_AGENT,
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+)
+_AUTHORIZE_HEADERS = MappingProxyType({"User-Agent": USER_AGENT, "Accept": "*/*"})
+_SUMMARY_HEADERS = MappingProxyType(
+    {"User-Agent": USER_AGENT, "Accept": "application/json"}
+)
+_PREFLIGHT_HEADERS = MappingProxyType({"User-Agent": USER_AGENT})
+_SUMMARY_PARAMS = MappingProxyType({"useHTS": "false", "useRounded": "false"})
+
+# Consecutive failures that open a host's circuit, and how long it stays open.
+# The window spans one and a half poll intervals, so the next scheduled poll
+# fails fast and the one after that probes the host again.
+_CIRCUIT_FAILURE_THRESHOLD = 3
+_CIRCUIT_RECOVERY_TIME = DEFAULT_SCAN_INTERVAL.total_seconds() * 1.5
 
 
 class WeightWatchersError(Exception):
@@ -28,6 +79,64 @@ class WeightWatchersConnectionError(WeightWatchersError):
     """Connection or timeout error."""
 
 
+class WeightWatchersServerError(WeightWatchersError):
+    """The WW backend answered with a 5xx status."""
+
+
+class _CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class _CircuitBreaker:
+    """Fail fast while a WW host keeps failing instead of waiting on timeouts."""
+
+    host: str
+    state: _CircuitState = _CircuitState.CLOSED
+    fail_count: int = 0
+    opened_at: float = 0.0
+    last_error: WeightWatchersError | None = None
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Run the enclosed requests unless the circuit is open."""
+        if self.state is _CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < _CIRCUIT_RECOVERY_TIME:
+                raise WeightWatchersConnectionError(
+                    f"Skipping {self.host} after repeated failures"
+                ) from self.last_error
+            self.state = _CircuitState.HALF_OPEN
+
+        try:
+            yield
+        except (WeightWatchersConnectionError, WeightWatchersServerError) as err:
+            self._record_failure(err)
+            raise
+        except WeightWatchersError:
+            # The host answered; the request, credentials or payload are the problem.
+            self._reset()
+            raise
+
+        self._reset()
+
+    def _record_failure(self, err: WeightWatchersError) -> None:
+        self.fail_count += 1
+        self.last_error = err
+        if (
+            self.state is _CircuitState.HALF_OPEN
+            or self.fail_count >= _CIRCUIT_FAILURE_THRESHOLD
+        ):
+            self.state = _CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+    def _reset(self) -> None:
+        self.state = _CircuitState.CLOSED
+        self.fail_count = 0
+        self.last_error = None
+
+
 @dataclass(slots=True, frozen=True)
 class WeightWatchersPointsSnapshot:
     """Points data returned by the WW My Day summary endpoint."""
@@ -36,26 +145,60 @@ class WeightWatchersPointsSnapshot:
     daily_points_used: int | None
     daily_activity_points_earned: int | None
     weekly_points_remaining: int | None
-    raw_details: dict[str, Any]
+    raw_daily_points_remaining: Any
+    raw_daily_points_used: Any
+    raw_daily_activity_points_earned: Any
+    raw_weekly_point_allowance_remaining: Any
 
 
 class WeightWatchersApiClient:
-    """Async client for Weight Watchers web APIs."""
+    """Async client for Weight Watchers web APIs.
+
+    The session is owned by the caller and must outlive the client; it is never
+    closed here so pooled connections can be reused across clients. Clients for
+    the same region should share one host semaphore to bound concurrent requests.
+    """
 
     def __init__(
         self,
         session: aiohttp.ClientSession,
-        region_domain: str,
+        region: str,
         username: str,
         password: str,
+        token_store: WeightWatchersTokenStore | None = None,
+        host_semaphore: asyncio.Semaphore | None = None,
     ) -> None:
+        if session is None:
+            raise ValueError("A shared aiohttp session is required")
+
         self._session = session
+        region_domain = REGION_TO_DOMAIN[region]
         self._region_domain = region_domain
         self._username = username
         self._password = password
+        self._token_store = token_store
+        self._host_semaphore = host_semaphore or asyncio.Semaphore(
+            DEFAULT_HOST_CONCURRENCY
+        )
+
+        (
+            self._auth_base_url,
+            self._cmx_base_url,
+            self._authenticate_url,
+            self._authorize_url,
+        ) = REGION_URLS[region]
+        self._summary_url_tmpl = f"{self._cmx_base_url}{CMX_SUMMARY_ENDPOINT}"
+
+        self._auth_circuit = _CircuitBreaker(f"auth.{region_domain}")
+        self._cmx_circuit = _CircuitBreaker(f"cmx.{region_domain}")
 
         self._id_token: str | None = None
-        self._id_token_exp: int | None = None
+        # Monotonic time after which the token must be refreshed.
+        self._id_token_deadline: float | None = None
+        self._token_store_loaded = token_store is None
+
+        self._cmx_preflight: asyncio.Task[None] | None = None
+        self._cmx_reached_at: float | None = None
 
     async def async_validate_credentials(self) -> WeightWatchersPointsSnapshot:
         """Validate credentials by authenticating and fetching today's summary."""
@@ -68,26 +211,81 @@ class WeightWatchersApiClient:
         if target_date is None:
             target_date = date.today()
 
+        (snapshot,) = await self.async_get_points_summary_bulk([target_date])
+        return snapshot
+
+    async def async_get_points_summary_bulk(
+        self, dates: list[date]
+    ) -> list[WeightWatchersPointsSnapshot]:
+        """Fetch My Day points summaries for several dates concurrently."""
         await self._async_ensure_id_token()
 
         try:
-            return await self._async_fetch_my_day_summary(target_date)
+            return await self._async_fetch_my_day_summaries(dates)
         except WeightWatchersAuthError:
+            if self._token_store is not None:
+                await self._token_store.async_remove()
             await self._async_ensure_id_token(force=True)
-            return await self._async_fetch_my_day_summary(target_date)
+            return await self._async_fetch_my_day_summaries(dates)
+
+    async def _async_fetch_my_day_summaries(
+        self, dates: list[date]
+    ) -> list[WeightWatchersPointsSnapshot]:
+        with self._cmx_circuit.guard():
+            try:
+                # TaskGroup cancels the remaining fetches once one of them fails.
+                async with asyncio.TaskGroup() as group:
+                    tasks = [
+                        group.create_task(self._async_fetch_my_day_summary(target_date))
+                        for target_date in dates
+                    ]
+            except ExceptionGroup as err:
+                # Surface the first failure as-is so callers can match on it.
+                first = err.exceptions[0]
+                raise first from first.__cause__
+
+            return [task.result() for task in tasks]
 
     async def _async_ensure_id_token(self, force: bool = False) -> None:
-        if not force and self._id_token and self._token_is_valid(self._id_token_exp):
+        if not self._token_store_loaded:
+            await self._async_load_stored_token()
+
+        if not force and self._token_is_valid():
+            return
+
+        async with self._host_semaphore:
+            with self._auth_circuit.guard():
+                session_token = await self._async_authenticate_login_api()
+                id_token = await self._async_exchange_for_id_token(session_token)
+
+        exp = self._extract_jwt_exp(id_token)
+        self._set_id_token(id_token, exp)
+
+        if self._token_store is not None and exp is not None:
+            await self._token_store.async_save(id_token, exp, self._region_domain)
+
+    async def _async_load_stored_token(self) -> None:
+        self._token_store_loaded = True
+        if self._token_store is None:
             return
 
-        session_token = await self._async_authenticate_login_api()
-        id_token = await self._async_exchange_for_id_token(session_token)
+        stored = await self._token_store.async_load(self._region_domain)
+        if stored is not None:
+            self._set_id_token(*stored)
 
+    def _set_id_token(self, id_token: str, exp: int | None) -> None:
         self._id_token = id_token
-        self._id_token_exp = self._extract_jwt_exp(id_token)
+        if exp is None:
+            self._id_token_deadline = None
+            return
+
+        # Convert the wall-clock expiry once so later checks ignore clock jumps.
+        self._id_token_deadline = (
+            time.monotonic() + (exp - time.time()) - TOKEN_EXPIRY_MARGIN
+        )
 
     async def _async_authenticate_login_api(self) -> str:
-        url = f"{self._auth_base_url}/login-apis/v1/authenticate"
+        url = self._authenticate_url
         payload = {
             "username": self._username,
             "password": self._password,
@@ -95,26 +293,22 @@ class WeightWatchersApiClient:
             "usernameEncoded": False,
             "retry": False,
         }
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
         try:
-            async with self._session.post(
-                url, json=payload, headers=headers, timeout=20
+            async with await self._request_with_retry(
+                "POST",
+                url,
+                json=payload,
+                headers=_LOGIN_HEADERS,
+                timeout=_REQUEST_TIMEOUT,
             ) as response:
                 if response.status == 401:
                     raise WeightWatchersAuthError(
                         "Invalid username, password, or region"
                     )
                 if response.status >= 400:
-                    raise WeightWatchersError(
-                        f"Login API request failed with status {response.status}"
-                    )
+                    raise self._status_error("Login API", response.status)
 
-                body = await response.json(content_type=None)
+                body = await response.json(content_type=None, loads=orjson.loads)
         except (TimeoutError, aiohttp.ClientError) as err:
             raise WeightWatchersConnectionError(
                 "Unable to reach Weight Watchers login API"
@@ -129,7 +323,7 @@ class WeightWatchersApiClient:
         return token_id
 
     async def _async_exchange_for_id_token(self, session_token: str) -> str:
-        url = f"{self._auth_base_url}/openam/oauth2/authorize"
+        url = self._authorize_url
 
         params = {
             "response_type": "id_token",
@@ -140,117 +334,195 @@ class WeightWatchersApiClient:
             "state": f"{self._cmx_base_url}/",
         }
 
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "*/*",
-        }
+        self._start_cmx_preflight()
 
         try:
-            async with self._session.get(
+            async with await self._request_with_retry(
+                "GET",
                 url,
                 params=params,
-                headers=headers,
+                headers=_AUTHORIZE_HEADERS,
                 cookies={"wwAuth2": session_token},
                 allow_redirects=False,
-                timeout=20,
+                timeout=_REQUEST_TIMEOUT,
             ) as response:
                 if response.status in (401, 403):
                     raise WeightWatchersAuthError("Failed to authorize WW session")
                 if response.status not in (301, 302):
-                    raise WeightWatchersError(
-                        f"Authorize request failed with status {response.status}"
-                    )
+                    raise self._status_error("Authorize", response.status)
 
                 redirect_url = response.headers.get("Location", "")
         except (TimeoutError, aiohttp.ClientError) as err:
+            self._cancel_cmx_preflight()
             raise WeightWatchersConnectionError(
                 "Unable to reach Weight Watchers auth API"
             ) from err
-
-        query = parse_qs(urlsplit(redirect_url).fragment)
-        id_token = query.get("id_token", [None])[0]
+        except BaseException:
+            self._cancel_cmx_preflight()
+            raise
+
+        # JWTs are URL-safe, so the fragment can be scanned without decoding.
+        fragment = redirect_url.partition("#")[2]
+        token_part = next(
+            (part for part in fragment.split("&") if part.startswith("id_token=")),
+            None,
+        )
+        id_token = token_part[len("id_token=") :] if token_part else None
         if not id_token:
             raise WeightWatchersAuthError("Authorize response did not include id_token")
 
         return id_token
 
+    def _start_cmx_preflight(self) -> None:
+        # Open a connection to the CMX host while authorize is in flight so the
+        # summary request that follows does not pay for DNS and TLS. Nothing
+        # waits for it; a slow CMX host must not hold up the token refresh.
+        if self._cmx_preflight is not None and not self._cmx_preflight.done():
+            return
+        if (
+            self._cmx_reached_at is not None
+            and time.monotonic() - self._cmx_reached_at < _CMX_WARM_WINDOW
+        ):
+            return
+
+        self._cmx_preflight = asyncio.create_task(self._async_preflight_cmx())
+
+    def _cancel_cmx_preflight(self) -> None:
+        if self._cmx_preflight is not None:
+            self._cmx_preflight.cancel()
+            self._cmx_preflight = None
+
+    async def _async_preflight_cmx(self) -> None:
+        if await self._async_preflight(self._cmx_base_url):
+            self._cmx_reached_at = time.monotonic()
+
+    async def _async_preflight(self, base_url: str) -> bool:
+        try:
+            async with self._session.head(
+                f"{base_url}/",
+                headers=_PREFLIGHT_HEADERS,
+                allow_redirects=False,
+                timeout=5,
+            ):
+                pass
+        except (TimeoutError, aiohttp.ClientError):
+            return False
+        return True
+
     async def _async_fetch_my_day_summary(
         self, target_date: date
     ) -> WeightWatchersPointsSnapshot:
         if not self._id_token:
             raise WeightWatchersAuthError("Missing session token")
 
-        endpoint = CMX_SUMMARY_ENDPOINT.format(date=target_date.isoformat())
-        url = f"{self._cmx_base_url}{endpoint}"
+        url = self._summary_url_tmpl.format(date=target_date.isoformat())
 
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "application/json",
-        }
         cookies = {
             "wwSession": self._id_token,
             "ww_privacy_settings": WW_PRIVACY_SETTINGS,
         }
 
-        try:
-            async with self._session.get(
-                url,
-                params={"useHTS": "false", "useRounded": "false"},
-                headers=headers,
-                cookies=cookies,
-                timeout=20,
-            ) as response:
-                if response.status in (401, 403):
-                    raise WeightWatchersAuthError("WW session is no longer valid")
-                if response.status >= 400:
-                    raise WeightWatchersError(
-                        f"My Day request failed with status {response.status}"
-                    )
+        async with self._host_semaphore:
+            try:
+                async with await self._request_with_retry(
+                    "GET",
+                    url,
+                    params=_SUMMARY_PARAMS,
+                    headers=_SUMMARY_HEADERS,
+                    cookies=cookies,
+                    timeout=_REQUEST_TIMEOUT,
+                ) as response:
+                    self._cmx_reached_at = time.monotonic()
+                    if response.status in (401, 403):
+                        raise WeightWatchersAuthError("WW session is no longer valid")
+                    if response.status >= 400:
+                        raise self._status_error("My Day", response.status)
+
+                    raw = await response.read()
+            except (TimeoutError, aiohttp.ClientError) as err:
+                raise WeightWatchersConnectionError(
+                    "Unable to reach Weight Watchers CMX API"
+                ) from err
 
-                body = await response.json(content_type=None)
-        except (TimeoutError, aiohttp.ClientError) as err:
-            raise WeightWatchersConnectionError(
-                "Unable to reach Weight Watchers CMX API"
+        try:
+            body = orjson.loads(raw)
+        except orjson.JSONDecodeError as err:
+            raise WeightWatchersError(
+                "Unexpected My Day response: invalid JSON"
             ) from err
 
-        details = body.get("pointsDetails")
+        # Only pointsDetails is kept; the rest of the payload is dropped here.
+        details = body.get("pointsDetails") if isinstance(body, dict) else None
+        del raw, body
+
         if not isinstance(details, dict):
             raise WeightWatchersError(
                 "Unexpected My Day response: missing pointsDetails"
             )
 
+        daily_remaining = details.get("dailyPointsRemaining")
+        daily_used = details.get("dailyPointsUsed")
+        activity_earned = details.get("dailyActivityPointsEarned")
+        weekly_remaining = details.get("weeklyPointAllowanceRemaining")
+
         return WeightWatchersPointsSnapshot(
-            daily_points_remaining=self._as_int(details.get("dailyPointsRemaining")),
-            daily_points_used=self._as_int(details.get("dailyPointsUsed")),
-            daily_activity_points_earned=self._as_int(
-                details.get("dailyActivityPointsEarned")
-            ),
-            weekly_points_remaining=self._as_int(
-                details.get("weeklyPointAllowanceRemaining")
-            ),
-            raw_details=details,
+            daily_points_remaining=self._as_int(daily_remaining),
+            daily_points_used=self._as_int(daily_used),
+            daily_activity_points_earned=self._as_int(activity_earned),
+            weekly_points_remaining=self._as_int(weekly_remaining),
+            raw_daily_points_remaining=daily_remaining,
+            raw_daily_points_used=daily_used,
+            raw_daily_activity_points_earned=activity_earned,
+            raw_weekly_point_allowance_remaining=weekly_remaining,
         )
 
-    @property
-    def _auth_base_url(self) -> str:
-        return f"https://auth.{self._region_domain}"
-
-    @property
-    def _cmx_base_url(self) -> str:
-        return f"https://cmx.{self._region_domain}"
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        max_attempts: int = 3,
+        base: float = 0.25,
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        async with asyncio.timeout(_RETRY_DEADLINE):
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    response = await self._session.request(method, url, **kwargs)
+                except (TimeoutError, aiohttp.ClientError):
+                    if attempt >= max_attempts:
+                        raise
+                else:
+                    if (
+                        response.status not in _RETRY_STATUSES
+                        or attempt >= max_attempts
+                    ):
+                        return response
+                    response.release()
+
+                await asyncio.sleep(random.uniform(0, base * 2 ** (attempt - 1)))
+
+    def _token_is_valid(self) -> bool:
+        return (
+            self._id_token_deadline is not None
+            and time.monotonic() < self._id_token_deadline
+        )
 
     @staticmethod
-    def _token_is_valid(expiration_epoch: int | None) -> bool:
-        if expiration_epoch is None:
-            return False
-        return int(time.time()) < expiration_epoch - 60
+    def _status_error(request: str, status: int) -> WeightWatchersError:
+        error_cls = WeightWatchersServerError if status >= 500 else WeightWatchersError
+        return error_cls(f"{request} request failed with status {status}")
 
     @staticmethod
     def _extract_jwt_exp(token: str) -> int | None:
         try:
-            payload = token.split(".")[1]
-            payload += "=" * (-len(payload) % 4)
-            data = json.loads(base64.urlsafe_b64decode(payload.encode("utf-8")))
+            start = token.index(".") + 1
+            payload = token[start : token.index(".", start)]
+            if pad := -len(payload) % 4:
+                payload += "=" * pad
+            data = orjson.loads(base64.urlsafe_b64decode(payload))
             exp = data.get("exp")
             return int(exp) if exp is not None else None
         except Exception:
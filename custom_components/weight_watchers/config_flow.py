@@ -121,15 +121,13 @@ class WeightWatchersConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str],
     ) -> bool:
         """Validate user supplied credentials."""
-        region_domain = REGION_TO_DOMAIN.get(region)
-        if region_domain is None:
+        if region not in REGION_TO_DOMAIN:
             errors["base"] = "unknown"
             return False
 
-        session = async_get_clientsession(self.hass)
         client = WeightWatchersApiClient(
-            session=session,
-            region_domain=region_domain,
+            session=async_get_clientsession(self.hass),
+            region=region,
             username=username,
             password=password,
         )
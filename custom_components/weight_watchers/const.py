@@ -10,6 +10,7 @@ CONF_REGION = "region"
 
 DEFAULT_REGION = "US"
 DEFAULT_SCAN_INTERVAL = timedelta(minutes=15)
+UPDATE_TIMEOUT = 25
 
 REGION_TO_DOMAIN: dict[str, str] = {
     "AU": "weightwatchers.com.au",
@@ -29,6 +30,17 @@ REGION_TO_DOMAIN: dict[str, str] = {
     "US": "weightwatchers.com",
 }
 
+# Region code -> (auth base, cmx base, authenticate URL, authorize URL).
+REGION_URLS: dict[str, tuple[str, str, str, str]] = {
+    region: (
+        f"https://auth.{domain}",
+        f"https://cmx.{domain}",
+        f"https://auth.{domain}/login-apis/v1/authenticate",
+        f"https://auth.{domain}/openam/oauth2/authorize",
+    )
+    for region, domain in REGION_TO_DOMAIN.items()
+}
+
 CMX_SUMMARY_ENDPOINT = "/api/v4/cmx/operations/composed/members/~/my-day-summary/{date}"
 
 WW_PRIVACY_SETTINGS = '{"doNotTrack":0,"doNotSell":0}'
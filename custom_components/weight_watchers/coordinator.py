@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -16,7 +17,7 @@ from .api import (
     WeightWatchersError,
     WeightWatchersPointsSnapshot,
 )
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, UPDATE_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,7 +46,12 @@ class WeightWatchersDataUpdateCoordinator(
 
     async def _async_update_data(self) -> WeightWatchersPointsSnapshot:
         try:
-            return await self.api.async_get_points_summary()
+            async with asyncio.timeout(UPDATE_TIMEOUT):
+                return await self.api.async_get_points_summary()
+        except TimeoutError as err:
+            raise UpdateFailed(
+                f"Weight Watchers did not respond within {UPDATE_TIMEOUT} seconds"
+            ) from err
         except WeightWatchersAuthError as err:
             raise ConfigEntryAuthFailed(
                 "Weight Watchers authentication failed"
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
@@ -14,7 +13,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
-from .api import WeightWatchersPointsSnapshot
 from .const import CONF_REGION, DOMAIN
 from .coordinator import WeightWatchersDataUpdateCoordinator
 
@@ -23,9 +21,11 @@ POINTS_UNIT = "pt"
 
 @dataclass(frozen=True, kw_only=True)
 class WeightWatchersSensorEntityDescription(SensorEntityDescription):
-    """Describes WW sensor entity."""
+    """Describes WW sensor entity.
 
-    value_fn: Callable[[WeightWatchersPointsSnapshot], int | None]
+    The key doubles as the name of the WeightWatchersPointsSnapshot field the
+    sensor reports.
+    """
 
 
 SENSOR_DESCRIPTIONS: tuple[WeightWatchersSensorEntityDescription, ...] = (
@@ -35,7 +35,6 @@ SENSOR_DESCRIPTIONS: tuple[WeightWatchersSensorEntityDescription, ...] = (
         native_unit_of_measurement=POINTS_UNIT,
         icon="mdi:counter",
         suggested_display_precision=0,
-        value_fn=lambda data: data.daily_points_remaining,
     ),
     WeightWatchersSensorEntityDescription(
         key="daily_points_used",
@@ -43,7 +42,6 @@ SENSOR_DESCRIPTIONS: tuple[WeightWatchersSensorEntityDescription, ...] = (
         native_unit_of_measurement=POINTS_UNIT,
         icon="mdi:food-apple",
         suggested_display_precision=0,
-        value_fn=lambda data: data.daily_points_used,
     ),
     WeightWatchersSensorEntityDescription(
         key="daily_activity_points_earned",
@@ -51,7 +49,6 @@ SENSOR_DESCRIPTIONS: tuple[WeightWatchersSensorEntityDescription, ...] = (
         native_unit_of_measurement=POINTS_UNIT,
         icon="mdi:run",
         suggested_display_precision=0,
-        value_fn=lambda data: data.daily_activity_points_earned,
     ),
     WeightWatchersSensorEntityDescription(
         key="weekly_points_remaining",
@@ -59,7 +56,6 @@ SENSOR_DESCRIPTIONS: tuple[WeightWatchersSensorEntityDescription, ...] = (
         native_unit_of_measurement=POINTS_UNIT,
         icon="mdi:calendar-week",
         suggested_display_precision=0,
-        value_fn=lambda data: data.weekly_points_remaining,
     ),
 )
 
@@ -72,8 +68,21 @@ async def async_setup_entry(
     """Set up WW sensors from a config entry."""
     coordinator: WeightWatchersDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    username = entry.data.get(CONF_USERNAME, "account")
+    region = entry.data.get(CONF_REGION, "WW")
+    account_slug = slugify(username)
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"Weight Watchers {username}",
+        model=f"Region {region}",
+        manufacturer="Weight Watchers",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
     async_add_entities(
-        WeightWatchersPointSensor(coordinator, entry, description)
+        WeightWatchersPointSensor(
+            coordinator, entry, description, account_slug, device_info
+        )
         for description in SENSOR_DESCRIPTIONS
     )
 
@@ -91,43 +100,42 @@ class WeightWatchersPointSensor(
         coordinator: WeightWatchersDataUpdateCoordinator,
         entry: ConfigEntry,
         description: WeightWatchersSensorEntityDescription,
+        account_slug: str,
+        device_info: DeviceInfo,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
 
         base_id = entry.unique_id or entry.entry_id
         self._attr_unique_id = f"{base_id}_{description.key}"
-        account_slug = slugify(entry.data.get(CONF_USERNAME, "account"))
         self._attr_suggested_object_id = (
             f"weight_watchers_{account_slug}_{description.key}"
         )
-
-        username = entry.data.get(CONF_USERNAME, "account")
-        region = entry.data.get(CONF_REGION, "WW")
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"Weight Watchers {username}",
-            model=f"Region {region}",
-            manufacturer="Weight Watchers",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> int | None:
         """Return the state."""
         if self.coordinator.data is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return getattr(self.coordinator.data, self.entity_description.key)
 
     @property
     def extra_state_attributes(self) -> dict[str, int | None]:
         """Expose raw WW API values used by this integration."""
-        details = self.coordinator.data.raw_details if self.coordinator.data else {}
+        data = self.coordinator.data
+        if data is None:
+            return dict.fromkeys(
+                (
+                    "dailyPointsRemaining",
+                    "dailyPointsUsed",
+                    "dailyActivityPointsEarned",
+                    "weeklyPointAllowanceRemaining",
+                )
+            )
         return {
-            "dailyPointsRemaining": details.get("dailyPointsRemaining"),
-            "dailyPointsUsed": details.get("dailyPointsUsed"),
-            "dailyActivityPointsEarned": details.get("dailyActivityPointsEarned"),
-            "weeklyPointAllowanceRemaining": details.get(
-                "weeklyPointAllowanceRemaining"
-            ),
+            "dailyPointsRemaining": data.raw_daily_points_remaining,
+            "dailyPointsUsed": data.raw_daily_points_used,
+            "dailyActivityPointsEarned": data.raw_daily_activity_points_earned,
+            "weeklyPointAllowanceRemaining": data.raw_weekly_point_allowance_remaining,
         }
@@ -0,0 +1,50 @@
+"""Persistent token storage for Weight Watchers."""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+
+class _StoredToken(TypedDict):
+    id_token: str
+    exp: int
+    region_domain: str
+
+
+class WeightWatchersTokenStore:
+    """Keep the WW id_token on disk so restarts can skip the login dance."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[_StoredToken] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}_token_{entry_id}"
+        )
+
+    async def async_load(self, region_domain: str) -> tuple[str, int] | None:
+        """Return the stored token and expiry if it belongs to this region."""
+        data = await self._store.async_load()
+        if not data or data.get("region_domain") != region_domain:
+            return None
+
+        id_token = data.get("id_token")
+        exp = data.get("exp")
+        if not isinstance(id_token, str) or not isinstance(exp, int):
+            return None
+
+        return id_token, exp
+
+    async def async_save(self, id_token: str, exp: int, region_domain: str) -> None:
+        """Persist a freshly issued token."""
+        await self._store.async_save(
+            {"id_token": id_token, "exp": exp, "region_domain": region_domain}
+        )
+
+    async def async_remove(self) -> None:
+        """Drop the stored token."""
+        await self._store.async_remove()